@@ -16,25 +16,34 @@ Almost perfect for norwii on linux (and using google slides).
 Fine for macos, but can create a spotlight ghost in specific situations (but always removed in next trigger).
 
 requirements:
+ python 3.11 or newer (tomllib)
  PySide6
  pynput
 
 and additionally on macos:
  objc 
+
+optionally on linux:
+ evdev (reads the presenter keys directly from /dev/input, falls back to pynput)
 """
-__version__ = "20251206"
+__version__ = "20261015"
 
 import sys
+import math
+import select
 import threading
+import time
 import os
-import configparser
+import re
+from collections import deque
+import tomllib
 from pathlib import Path
-from pynput import keyboard
+from pynput import keyboard, mouse
 
 # nuitka needs pyside instead of pyqt
 from PySide6.QtWidgets import QApplication, QWidget
-from PySide6.QtCore import Qt, QObject, QTimer, QPoint, QPointF, QRect
-from PySide6.QtGui import QPainter, QBrush, QColor, QRadialGradient, QCursor, QScreen, QPen
+from PySide6.QtCore import Qt, QObject, QTimer, QPoint, QPointF, QRect, QSize
+from PySide6.QtGui import QPainter, QBrush, QColor, QRadialGradient, QCursor, QScreen, QPen, QPixmap
 from PySide6.QtCore import Signal as pyqtSignal
 
 IS_DARWIN = sys.platform == "darwin"
@@ -56,16 +65,48 @@ if IS_DARWIN:
         print("Warning: PyObjC not available or failed to import. macOS-specific behavior will not be applied.")
         print("Install with: pip install pyobjc")
         IS_DARWIN = False
+
+HAS_EVDEV = False
+if sys.platform.startswith("linux"):
+    try:
+        import evdev
+        from evdev import ecodes
+        HAS_EVDEV = True
+    except Exception:
+        # optional, pynput is used instead
+        pass
     
     
 hotkey_listener = None
+mouse_listener = None
 
 # -------------------------
 # Configuration file
 # -------------------------
+# "r, g, b, a" color strings
+_RGBA_RE = re.compile(r'\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*')
+
 class Config:
     CONFIG_DIR = Path.home() / ".config" / "pypresenter"
-    CONFIG_FILE = CONFIG_DIR / "config.ini"
+    CONFIG_FILE = CONFIG_DIR / "config.toml"
+    # used before the TOML config, it is not read anymore
+    OLD_CONFIG_FILE = CONFIG_DIR / "config.ini"
+    # kind of effect drawn in each mode
+    MODE_KIND = {"SPOTLIGHT_HOLD": "spot", "SPOTLIGHT_TOGGLE": "spot", "LASER": "laser"}
+
+    __slots__ = (
+        # settings
+        'MODES', 'SPOT_RADIUS', 'BACKGROUND_ALPHA', 'SPOT_RING_THICKNESS',
+        'SPOT_RING_COLOR_R', 'SPOT_RING_COLOR_G', 'SPOT_RING_COLOR_B', 'SPOT_RING_COLOR_A',
+        'SPOT_MOVE_THRESHOLD', 'LASER_MAX_TRAIL_LENGTH', 'LASER_BASE_RADIUS', 'LASER_HEAD_MULTIPLIER',
+        'LASER_COLOR_R', 'LASER_COLOR_G', 'LASER_COLOR_B', 'LASER_COLOR_A', 'LASER_MIN_ALPHA',
+        'device_pixel_ratio',
+        # Qt resources, see build_qt_resources
+        'SPOT_RING_COLOR', 'LASER_COLOR_BASE', 'BACKGROUND_COLOR', 'OPAQUE_BLACK',
+        'hole_brush', 'hole_radius', 'rim_brush', 'rim_radius', 'spot_pixmap', 'spot_offset', 'spot_size',
+        'laser_brushes', 'laser_head_brush', 'laser_dot_pixmaps', 'laser_head_pixmap',
+        'laser_dot_offset', 'laser_head_offset',
+    )
 
     def __init__(self):
         # default settings. values in config override these
@@ -77,6 +118,7 @@ class Config:
         self.SPOT_RING_COLOR_G = 105
         self.SPOT_RING_COLOR_B = 180
         self.SPOT_RING_COLOR_A = 255
+        self.SPOT_MOVE_THRESHOLD = 2
         self.LASER_MAX_TRAIL_LENGTH = 15
         self.LASER_BASE_RADIUS = 12.0
         self.LASER_HEAD_MULTIPLIER = 1.5
@@ -86,80 +128,127 @@ class Config:
         self.LASER_COLOR_A = 255
         self.LASER_MIN_ALPHA = 25
 
-        self.SPOT_RING_COLOR = QColor(self.SPOT_RING_COLOR_R, self.SPOT_RING_COLOR_G,
-                                      self.SPOT_RING_COLOR_B, self.SPOT_RING_COLOR_A)
-        self.LASER_COLOR_BASE = QColor(self.LASER_COLOR_R, self.LASER_COLOR_G,
-                                       self.LASER_COLOR_B, self.LASER_COLOR_A)
-        self._update_values()
+        # of the screen the overlay is on, pixmaps are rendered at this resolution
+        self.device_pixel_ratio = 1.0
 
 
     def create_default_config_file(self):
         self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        config = configparser.ConfigParser()
-        config['General'] = {'modes': ', '.join(self.MODES)}
-        config['Spotlight'] = {
-            'spot_radius': str(self.SPOT_RADIUS),
-            'background_alpha': str(self.BACKGROUND_ALPHA),
-            'ring_thickness': str(self.SPOT_RING_THICKNESS),
-            'ring_color_rgba': f"{self.SPOT_RING_COLOR_R}, {self.SPOT_RING_COLOR_G}, {self.SPOT_RING_COLOR_B}, {self.SPOT_RING_COLOR_A}",
-        }
-        config['Laser'] = {
-            'max_trail_length': str(self.LASER_MAX_TRAIL_LENGTH),
-            'base_radius': str(self.LASER_BASE_RADIUS),
-            'head_multiplier': str(self.LASER_HEAD_MULTIPLIER),
-            'color_rgba': f"{self.LASER_COLOR_R}, {self.LASER_COLOR_G}, {self.LASER_COLOR_B}, {self.LASER_COLOR_A}",
-            'min_alpha': str(self.LASER_MIN_ALPHA),
-        }
-        with open(self.CONFIG_FILE, 'w') as configfile:
-            config.write(configfile)
+        modes = ', '.join(f'"{m}"' for m in self.MODES)
+        self.CONFIG_FILE.write_text(
+            f"[General]\n"
+            f"modes = [{modes}]\n"
+            f"\n"
+            f"[Spotlight]\n"
+            f"spot_radius = {float(self.SPOT_RADIUS)}\n"
+            f"background_alpha = {self.BACKGROUND_ALPHA}\n"
+            f"ring_thickness = {float(self.SPOT_RING_THICKNESS)}\n"
+            f'ring_color_rgba = "{self.SPOT_RING_COLOR_R}, {self.SPOT_RING_COLOR_G}, {self.SPOT_RING_COLOR_B}, {self.SPOT_RING_COLOR_A}"\n'
+            f"move_threshold = {self.SPOT_MOVE_THRESHOLD}\n"
+            f"\n"
+            f"[Laser]\n"
+            f"max_trail_length = {self.LASER_MAX_TRAIL_LENGTH}\n"
+            f"base_radius = {float(self.LASER_BASE_RADIUS)}\n"
+            f"head_multiplier = {float(self.LASER_HEAD_MULTIPLIER)}\n"
+            f'color_rgba = "{self.LASER_COLOR_R}, {self.LASER_COLOR_G}, {self.LASER_COLOR_B}, {self.LASER_COLOR_A}"\n'
+            f"min_alpha = {self.LASER_MIN_ALPHA}\n"
+        )
         print(f"Created default configuration file: {self.CONFIG_FILE}")
 
     def load_config(self):
-        parser = configparser.ConfigParser()
         if not self.CONFIG_FILE.exists():
+            # nothing to parse, the defaults are already in place
             self.create_default_config_file()
-            parser.read(self.CONFIG_FILE)
-        else:
-            parser.read(self.CONFIG_FILE)
+            if self.OLD_CONFIG_FILE.exists():
+                print(f"Note: {self.OLD_CONFIG_FILE} is not read anymore, "
+                      f"copy any changed values over to {self.CONFIG_FILE}.")
+            return
+
+        try:
+            # TOML files are UTF-8, whatever the locale
+            with open(self.CONFIG_FILE, 'rb') as f:
+                data = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            # the message contains the line and column
+            print(f"Error parsing {self.CONFIG_FILE}: {e}. Using default settings.")
+            return
 
         def parse_color_rgba(rgba_str):
-            try:
-                r, g, b, a = map(lambda x: int(x.strip()), rgba_str.split(','))
-                return QColor(r, g, b, a)
-            except Exception as e:
-                print(f"Error parsing color string '{rgba_str}': {e}. Using default.")
+            m = _RGBA_RE.fullmatch(rgba_str) if isinstance(rgba_str, str) else None
+            if m is None:
+                print(f"Error parsing color string '{rgba_str}': expected 'r, g, b, a'. Using default.")
                 return None
-
-        if 'General' in parser and 'modes' in parser['General']:
-            modes_str = parser['General']['modes']
-            self.MODES = [m.strip().upper() for m in modes_str.split(',') if m.strip()]
-
-        if 'Spotlight' in parser:
-            s_cfg = parser['Spotlight']
-            self.SPOT_RADIUS = s_cfg.getfloat('spot_radius', self.SPOT_RADIUS)
-            self.BACKGROUND_ALPHA = s_cfg.getint('background_alpha', self.BACKGROUND_ALPHA)
-            self.SPOT_RING_THICKNESS = s_cfg.getfloat('ring_thickness', self.SPOT_RING_THICKNESS)
-            ring_color = parse_color_rgba(s_cfg.get('ring_color_rgba', ''))
+            return int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4))
+
+        def get_section(name):
+            section = data.get(name, {})
+            if not isinstance(section, dict):
+                print(f"Error parsing [{name}]: expected a table, got {section!r}. Using defaults.")
+                return {}
+            return section
+
+        def get_number(section, key, convert, default):
+            if key not in section:
+                return default
+            try:
+                return convert(section[key])
+            except (TypeError, ValueError):
+                print(f"Error parsing {key} = {section[key]!r}: expected a number. Using default.")
+                return default
+
+        g_cfg = get_section('General')
+        if 'modes' in g_cfg:
+            modes = g_cfg['modes']
+            if isinstance(modes, str):
+                # "SPOTLIGHT_HOLD, LASER" as in the old ini file
+                modes = modes.split(',')
+            if isinstance(modes, list) and all(isinstance(m, str) for m in modes):
+                self.MODES = [m.strip().upper() for m in modes if m.strip()]
+            else:
+                print(f"Error parsing modes {modes!r}: expected a list of mode names. Using default.")
+
+        s_cfg = get_section('Spotlight')
+        if s_cfg:
+            self.SPOT_RADIUS = get_number(s_cfg, 'spot_radius', float, self.SPOT_RADIUS)
+            self.BACKGROUND_ALPHA = get_number(s_cfg, 'background_alpha', int, self.BACKGROUND_ALPHA)
+            self.SPOT_RING_THICKNESS = get_number(s_cfg, 'ring_thickness', float, self.SPOT_RING_THICKNESS)
+            self.SPOT_MOVE_THRESHOLD = get_number(s_cfg, 'move_threshold', int, self.SPOT_MOVE_THRESHOLD)
+            ring_color = parse_color_rgba(s_cfg['ring_color_rgba']) if 'ring_color_rgba' in s_cfg else None
             if ring_color is not None:
-                self.SPOT_RING_COLOR = ring_color
-
-        if 'Laser' in parser:
-            l_cfg = parser['Laser']
-            self.LASER_MAX_TRAIL_LENGTH = l_cfg.getint('max_trail_length', self.LASER_MAX_TRAIL_LENGTH)
-            self.LASER_BASE_RADIUS = l_cfg.getfloat('base_radius', self.LASER_BASE_RADIUS)
-            self.LASER_HEAD_MULTIPLIER = l_cfg.getfloat('head_multiplier', self.LASER_HEAD_MULTIPLIER)
-            self.LASER_MIN_ALPHA = l_cfg.getint('min_alpha', self.LASER_MIN_ALPHA)
-            laser_color = parse_color_rgba(l_cfg.get('color_rgba', ''))
+                (self.SPOT_RING_COLOR_R, self.SPOT_RING_COLOR_G,
+                 self.SPOT_RING_COLOR_B, self.SPOT_RING_COLOR_A) = ring_color
+
+        l_cfg = get_section('Laser')
+        if l_cfg:
+            self.LASER_MAX_TRAIL_LENGTH = get_number(l_cfg, 'max_trail_length', int, self.LASER_MAX_TRAIL_LENGTH)
+            self.LASER_BASE_RADIUS = get_number(l_cfg, 'base_radius', float, self.LASER_BASE_RADIUS)
+            self.LASER_HEAD_MULTIPLIER = get_number(l_cfg, 'head_multiplier', float, self.LASER_HEAD_MULTIPLIER)
+            self.LASER_MIN_ALPHA = get_number(l_cfg, 'min_alpha', int, self.LASER_MIN_ALPHA)
+            laser_color = parse_color_rgba(l_cfg['color_rgba']) if 'color_rgba' in l_cfg else None
             if laser_color is not None:
-                self.LASER_COLOR_BASE = laser_color
+                (self.LASER_COLOR_R, self.LASER_COLOR_G,
+                 self.LASER_COLOR_B, self.LASER_COLOR_A) = laser_color
 
-        self._update_values()
         print(f"Configuration loaded from {self.CONFIG_FILE}.")
 
+    def build_qt_resources(self, device_pixel_ratio=1.0):
+        """
+        create the colors, brushes and images used for painting
+          needs a QApplication, so it is called from main() after loading the config
+          images are rendered for the given device pixel ratio
+        """
+        self.device_pixel_ratio = device_pixel_ratio
+
+        self.SPOT_RING_COLOR = QColor(self.SPOT_RING_COLOR_R, self.SPOT_RING_COLOR_G,
+                                      self.SPOT_RING_COLOR_B, self.SPOT_RING_COLOR_A)
+        self.LASER_COLOR_BASE = QColor(self.LASER_COLOR_R, self.LASER_COLOR_G,
+                                       self.LASER_COLOR_B, self.LASER_COLOR_A)
+        self._update_values()
+
     def _update_values(self):
         """
         define the values to be used later on
-          SPOT_RING_COLOR and LASER_COLOR_BASE are directly defined in init and load
+          SPOT_RING_COLOR and LASER_COLOR_BASE are defined in build_qt_resources
         """
         self.BACKGROUND_COLOR = QColor(0, 0, 0, self.BACKGROUND_ALPHA)
         self.OPAQUE_BLACK = QColor(0, 0, 0, 255)
@@ -184,9 +273,91 @@ class Config:
 
         self.rim_radius = float(self.SPOT_RADIUS)
 
-        
-global_config = Config()
-global_config.load_config()
+        # laser brushes per trail position, from the oldest dot to the newest
+        n = self.LASER_MAX_TRAIL_LENGTH
+        self.laser_brushes = []
+        for i in range(n):
+            t = i / float(n - 1) if n > 1 else 1.0
+            color = QColor(self.LASER_COLOR_BASE)
+            color.setAlpha(int(self.LASER_MIN_ALPHA + (255 - self.LASER_MIN_ALPHA) * t))
+            self.laser_brushes.append(QBrush(color))
+        head_color = QColor(self.LASER_COLOR_BASE)
+        head_color.setAlpha(255)
+        self.laser_head_brush = QBrush(head_color)
+
+        self._render_pixmaps()
+
+    def set_device_pixel_ratio(self, dpr):
+        """re-render the pixmaps when the overlay moved to a screen with another pixel ratio"""
+        if dpr == self.device_pixel_ratio:
+            return
+        self.device_pixel_ratio = dpr
+        self._render_pixmaps()
+
+    def _render_pixmaps(self):
+        self._render_spot_pixmap()
+
+        # laser dots as pixmaps, blitting is cheaper than antialiased ellipses
+        dpr = self.device_pixel_ratio
+        dot_radius = self.LASER_BASE_RADIUS
+        head_radius = self.LASER_BASE_RADIUS * self.LASER_HEAD_MULTIPLIER
+        self.laser_dot_pixmaps = [self._render_dot(dot_radius, brush, dpr) for brush in self.laser_brushes]
+        self.laser_head_pixmap = self._render_dot(head_radius, self.laser_head_brush, dpr)
+        self.laser_dot_offset = math.ceil(dot_radius) + 1
+        self.laser_head_offset = math.ceil(head_radius) + 1
+
+    @staticmethod
+    def _render_dot(radius, brush, dpr):
+        # centered at (ceil(radius)+1, ceil(radius)+1) in logical pixels, see laser_dot_offset
+        size = 2*math.ceil(radius) + 2
+        # device pixels, drawPixmap scales it back by the ratio set on it
+        pixmap = QPixmap(math.ceil(size*dpr), math.ceil(size*dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        with QPainter(pixmap) as painter:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(brush)
+            painter.drawEllipse(QPointF(size/2, size/2), radius, radius)
+        return pixmap
+
+    def _render_spot_pixmap(self):
+        """
+        pre-render the spotlight tile (dim background, hole and rim) once,
+        so paintEvent only has to blit it at the cursor position
+        """
+        size = int(2*self.rim_radius) + 2
+        center = QPointF(size/2, size/2)
+        # a pixmap is kept in the format of the window surface, so blitting needs no conversion.
+        # it has device pixels, the painter and drawPixmap work in logical ones
+        dpr = self.device_pixel_ratio
+        pixmap = QPixmap(math.ceil(size*dpr), math.ceil(size*dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(self.BACKGROUND_COLOR)
+
+        with QPainter(pixmap) as painter:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+            # cut transparent hole
+            painter.setBrush(self.hole_brush)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationOut)
+            painter.drawEllipse(center, self.hole_radius, self.hole_radius)
+
+            # draw rim around hole
+            self.rim_brush.setCenter(center)
+            self.rim_brush.setFocalPoint(center)
+            painter.setBrush(self.rim_brush)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+            painter.drawEllipse(center, self.rim_radius, self.rim_radius)
+
+        self.spot_pixmap = pixmap
+        self.spot_offset = QPoint(size//2, size//2)
+        self.spot_size = QSize(size, size)
+
+
+# created in main() once the QApplication exists
+global_config = None
 
 # -------------------------
 # Global state to be accessed by thread
@@ -221,7 +392,7 @@ class GlobalState:
         # which is toggled by the hotkeys.
         return True
 
-global_state = GlobalState(global_config)
+global_state = None
 
 # -------------------------
 # Signals
@@ -231,14 +402,26 @@ class KeyboardSignalEmitter(QObject):
     effect_activate = pyqtSignal()
     effect_deactivate = pyqtSignal()
     mode_changed = pyqtSignal(str)
+    mouse_moved = pyqtSignal()
     screen_changed = pyqtSignal()
     app_quit = pyqtSignal()
 
+    # read by the mouse listener thread: moves are only forwarded while an effect is shown,
+    # and only one mouse_moved is queued at a time
+    tracking = False
+    move_pending = False
+
 # -------------------------
 # PresenterOverlay
 # -------------------------
 class PresenterOverlay(QWidget):
+    # macOS: lookups of the NSWindow before giving up, and the delay between them
+    NS_CONFIGURE_ATTEMPTS = 10
+    NS_CONFIGURE_RETRY_MS = 50
+
     _current_geometry = None
+    # geometry of the screen last found under the cursor, reset when the screens change
+    _cursor_screen_geometry = None
     
     def __init__(self, initial_geometry: QRect, emitter: QObject, config: Config):
         super().__init__()
@@ -248,24 +431,26 @@ class PresenterOverlay(QWidget):
         # --- internal state first ---
         self.overlay_active = False 
         self.mouse_pos = QPoint(0, 0)
-        self.laser_trail = []
+        # (x, y) tuples; appending to a full trail drops the oldest point
+        self.laser_trail = deque(maxlen=self.config.LASER_MAX_TRAIL_LENGTH)
+        # set by mouse moves, the laser trail only decays on ticks without one
+        self._moved_since_tick = False
+        # area painted in the previous frame, repainted to erase it
+        self._last_dirty = QRect()
+        # macOS: NSWindow adjusted after the first show, retried while it does not exist yet
+        self._ns_configured = False
+        self._ns_attempts = 0
         # which mode flags (updated on mode change)
         self.is_spotlight_mode = False
         self.is_laser_mode = False
 
-        # Timer: used for laser animation and also a lower-rate spotlight poll when needed.
-        self.interval_laser = 30
-        self.interval_spotlight = 30 
+        # Timer: only used for laser trail decay, mouse moves arrive via the mouse listener
+        self.interval_laser = 50
 
         self.timer = QTimer(self)
         self.timer.setInterval(self.interval_laser)
         self.timer.timeout.connect(self._on_timer_tick)
         
-        # QTimer to check for screen changes (e.g., projector connected/disconnected)
-        self.screen_check_timer = QTimer(self)
-        self.screen_check_timer.setInterval(1000) # Check every 1 second
-        self.screen_check_timer.timeout.connect(self._check_screen_change)
-        
         # Window flags: keep ToolTip plus TransparentForInput to be click-through
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint |
@@ -274,16 +459,30 @@ class PresenterOverlay(QWidget):
             Qt.WindowType.WindowTransparentForInput
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        # paintEvent replaces every pixel of the dirty area itself, so Qt can skip clearing it
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
 
         # Set initial geometry and store it
         self.setGeometry(initial_geometry)
         PresenterOverlay._current_geometry = initial_geometry
+        # global position of the window, to map the cursor without asking the window system
+        self._screen_origin = initial_geometry.topLeft()
 
         # connect signals
         self.emitter.mode_changed.connect(self._on_mode_changed)
+        self.emitter.mouse_moved.connect(self._on_mouse_moved)
         self.emitter.screen_changed.connect(self._on_screen_changed)
         self.emitter.effect_activate.connect(self.activate_effect) 
         self.emitter.effect_deactivate.connect(self.deactivate_effect) 
+
+        # screen changes (e.g., projector connected/disconnected) are signalled by Qt,
+        # moving to another screen is noticed on activation and in _on_mouse_moved
+        app = QApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._on_screens_changed)
+        app.primaryScreenChanged.connect(self._on_screens_changed)
+        for screen in QApplication.screens():
+            screen.geometryChanged.connect(self._on_screens_changed)
         
         # Initial setup: The overlay should be shown immediately and always
         try:
@@ -298,13 +497,6 @@ class PresenterOverlay(QWidget):
         
         self.show()
         self.raise_()
-        
-        # Start the screen check timer immediately
-        self.screen_check_timer.start()
-
-        # macOS: make persistent overlay (will noop on linux)
-        if IS_DARWIN:
-            QTimer.singleShot(50, self.make_persistent_overlay)
 
         # Enable mouse tracking *only* for internal events
         self.setMouseTracking(True)
@@ -324,6 +516,8 @@ class PresenterOverlay(QWidget):
 
         geom = self._get_current_screen_geometry()
         self.setGeometry(geom)
+        self._screen_origin = geom.topLeft()
+        self.config.set_device_pixel_ratio(self._screen_device_pixel_ratio(geom))
         
         # 4. Force an immediate repaint on the NEW geometry to ensure the window manager
         # clears the new region's composition buffer.
@@ -359,19 +553,16 @@ class PresenterOverlay(QWidget):
         self._update_timer_state() # Start/stop timer based on new mode
 
     def _update_mode_flags(self):
-        m = global_state.current_mode
-        self.is_spotlight_mode = (m in ["SPOTLIGHT_HOLD", "SPOTLIGHT_TOGGLE"])
-        self.is_laser_mode = (m == "LASER")
+        kind = self.config.MODE_KIND.get(global_state.current_mode)
+        self.is_spotlight_mode = (kind == "spot")
+        self.is_laser_mode = (kind == "laser")
 
     def _update_timer_state(self):
-        if self.is_laser_mode:
+        # the timer only decays a visible laser trail
+        if self.is_laser_mode and self.overlay_active:
             self.timer.setInterval(self.interval_laser)
             if not self.timer.isActive():
                 self.timer.start()
-        elif self.is_spotlight_mode:
-            self.timer.setInterval(self.interval_spotlight)
-            if not self.timer.isActive():
-                self.timer.start()
         else:
             self.timer.stop()
             
@@ -380,7 +571,12 @@ class PresenterOverlay(QWidget):
     # -----------------
     def activate_effect(self):
         if not self.overlay_active:
+            # mouse moves are not tracked while inactive, follow the cursor to its screen now
+            if not PresenterOverlay._current_geometry.contains(QCursor.pos()):
+                self._check_screen_change()
             self.overlay_active = True
+            self.emitter.tracking = True
+            self._update_timer_state()
 
             # On macOS, record the current frontmost app
             if IS_DARWIN:
@@ -392,16 +588,29 @@ class PresenterOverlay(QWidget):
                     self._previous_frontmost_app = None
                     
             # Set the initial mouse position and force a repaint
-            self.mouse_pos = self.mapFromGlobal(QCursor.pos())
-            self.update() 
+            self.mouse_pos = QCursor.pos() - self._screen_origin
+            self._last_dirty = self._dirty_rect()
+            if self.is_spotlight_mode:
+                # the whole screen gets dimmed
+                self.update()
+            elif not self._last_dirty.isEmpty():
+                self.update(self._last_dirty)
 
     def deactivate_effect(self, is_mode_switch=False):
         if self.overlay_active:
             self.overlay_active = False
+            self.emitter.tracking = False
+            self._update_timer_state()
             self.laser_trail.clear()
+            self._moved_since_tick = False
             
             # Force a repaint to draw the clear background (fully transparent)
-            self.update() 
+            if self.is_spotlight_mode:
+                self.update()
+            elif not self._last_dirty.isEmpty():
+                # only the laser trail was painted
+                self.update(self._last_dirty)
+            self._last_dirty = QRect()
             
             # Only try to restore focus on an actual deactivation, not a mode switch
             if IS_DARWIN and not is_mode_switch and getattr(self, "_previous_frontmost_app", None) is not None:
@@ -425,158 +634,335 @@ class PresenterOverlay(QWidget):
                     self._previous_frontmost_app = None
 
     # -----------------
-    # timer tick: update cursor position and handle laser trail decay
+    # mouse move: update cursor position and laser trail
     # -----------------
-    def _on_timer_tick(self):
-        
-        # 1. Get new position
+    def _on_mouse_moved(self):
+        # cleared before reading the position, so a move after the read queues a new signal
+        self.emitter.move_pending = False
+        # pynput reports device pixels, Qt's logical pixels are read here instead
         pos = QCursor.pos()
-        local_pos = self.mapFromGlobal(pos)
-        
-        needs_repaint = False
-        
+        if not PresenterOverlay._current_geometry.contains(pos):
+            # the cursor left the screen the overlay is on
+            self._check_screen_change()
+        local_pos = pos - self._screen_origin
         if local_pos == self.mouse_pos:
-            # Only update for laser trail decay if mouse hasn't moved
-            if self.is_laser_mode and len(self.laser_trail) > 1:
-                self.laser_trail.pop(0)
-                needs_repaint = True
-        else:
-            self.mouse_pos = local_pos
-            needs_repaint = True
-            
+            return
+        # ignore the jitter of a hand-held presenter, the spotlight is too large to notice it
+        if self.is_spotlight_mode and \
+                (local_pos - self.mouse_pos).manhattanLength() < self.config.SPOT_MOVE_THRESHOLD:
+            return
+        self.mouse_pos = local_pos
+        moved_before = self._moved_since_tick
+        self._moved_since_tick = True
+
+        if self.overlay_active:
             # --- Handle LASER trail animation ---
-            if self.is_laser_mode and self.overlay_active:
-                self.laser_trail.append(QPointF(self.mouse_pos))
-                if len(self.laser_trail) > self.config.LASER_MAX_TRAIL_LENGTH:
-                    self.laser_trail.pop(0)
+            if self.is_laser_mode:
+                # one point per timer tick, later moves in the same tick only move the head,
+                # so the trail covers the same time at any mouse report rate
+                point = (local_pos.x(), local_pos.y())
+                if moved_before and self.laser_trail:
+                    self.laser_trail[-1] = point
+                else:
+                    self.laser_trail.append(point)
+            self._repaint_dirty()
 
-        if needs_repaint and self.overlay_active:
-            self.update()
+    # -----------------
+    # timer tick: handle laser trail decay
+    # -----------------
+    def _on_timer_tick(self):
+        # Shrink the laser trail while the mouse stands still
+        if self._moved_since_tick:
+            self._moved_since_tick = False
+            return
+        if self.overlay_active and self.is_laser_mode and len(self.laser_trail) > 1:
+            self.laser_trail.popleft()
+            self._repaint_dirty()
+
+    def _repaint_dirty(self):
+        # only repaint the area of the previous and the new frame
+        new_dirty = self._dirty_rect()
+        self.update(new_dirty.united(self._last_dirty))
+        self._last_dirty = new_dirty
+
+    def _dirty_rect(self):
+        """Bounding box of what the current effect paints, with a small margin."""
+        config = self.config
+        if self.is_spotlight_mode:
+            rect = QRect(self.mouse_pos - config.spot_offset, config.spot_size)
+            return rect.adjusted(-2, -2, 2, 2)
+        trail = self.laser_trail
+        if self.is_laser_mode and trail:
+            xs = [x for x, _ in trail]
+            ys = [y for _, y in trail]
+            r = config.laser_head_offset + 2
+            return QRect(min(xs) - r, min(ys) - r,
+                         max(xs) - min(xs) + 2*r, max(ys) - min(ys) + 2*r)
+        return QRect()
 
 
     # -----------------
     # geometry helper
     # -----------------
-    def _get_current_screen_geometry(self):
-        cursor_pos = QCursor.pos()
-        screen = QApplication.screenAt(cursor_pos)
-        if screen is None:
-            return QApplication.primaryScreen().geometry()
-        return screen.geometry()
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self._screen_origin = self.geometry().topLeft()
+
+    @classmethod
+    def _get_current_screen_geometry(cls):
+        pos = QCursor.pos()
+        geom = cls._cursor_screen_geometry
+        # screenAt walks all screens, skip it while the cursor stays on the same one
+        if geom is not None and geom.contains(pos):
+            return geom
+        screen = QApplication.screenAt(pos) or QApplication.primaryScreen()
+        geom = screen.geometry()
+        cls._cursor_screen_geometry = geom
+        return geom
+
+    @staticmethod
+    def _screen_device_pixel_ratio(geom):
+        screen = QApplication.screenAt(geom.center()) or QApplication.primaryScreen()
+        return screen.devicePixelRatio()
+
+    def _on_screen_added(self, screen):
+        screen.geometryChanged.connect(self._on_screens_changed)
+        self._on_screens_changed()
+
+    def _on_screens_changed(self, *args):
+        PresenterOverlay._cursor_screen_geometry = None
+        self._check_screen_change()
 
     # -----------------
     # paint event
     # -----------------
+    @staticmethod
+    def _rects_around(outer, inner):
+        """Split the part of outer that is not covered by inner into at most 4 rects."""
+        inner = inner.intersected(outer)
+        if inner.isEmpty():
+            return [outer]
+        rects = [
+            QRect(outer.left(), outer.top(), outer.width(), inner.top() - outer.top()),          # above
+            QRect(outer.left(), inner.bottom() + 1, outer.width(), outer.bottom() - inner.bottom()),  # below
+            QRect(outer.left(), inner.top(), inner.left() - outer.left(), inner.height()),       # left
+            QRect(inner.right() + 1, inner.top(), outer.right() - inner.right(), inner.height()),  # right
+        ]
+        return [r for r in rects if not r.isEmpty()]
+
     def paintEvent(self, event):
+        # only the exposed area needs painting, the rest of the window keeps its content
+        dirty = event.rect()
+        # local names for everything read per frame
+        config = self.config
+        trail = self.laser_trail
         with QPainter(self) as painter:
+            painter.setClipRect(dirty)
+            # no antialiasing: only integer rects and pre-rendered (antialiased) pixmaps are drawn
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing) 
-    
-            # Always clear the previous frame fully transparently
-            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-            painter.fillRect(self.rect(), QColor(0,0,0,0)) 
-
-            if not self.overlay_active:
-                return
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
 
             # Spotlight drawing
-            if self.is_spotlight_mode:
-                center = QPointF(self.mouse_pos)
-                
-                # 1. Draw dim background  
-                painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-                painter.fillRect(self.rect(), self.config.BACKGROUND_COLOR)
+            if self.overlay_active and self.is_spotlight_mode:
+                spot_pixmap = config.spot_pixmap
+                tile = QRect(self.mouse_pos - config.spot_offset, config.spot_size)
+
+                # 1. Draw dim background around the tile, without overdrawing it
+                background = config.BACKGROUND_COLOR
+                for rect in self._rects_around(dirty, tile):
+                    painter.fillRect(rect, background)
                 
-                # 2. Cut transparent hole
-                painter.setBrush(self.config.hole_brush)
-                painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationOut) 
-                painter.drawEllipse(center,  
-                                    self.config.hole_radius,
-                                    self.config.hole_radius)
-        
-                # 3. Draw rim around hole
-                self.config.rim_brush.setCenter(center)
-                self.config.rim_brush.setFocalPoint(center)
-                painter.setBrush(self.config.rim_brush)
-                painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-                painter.drawEllipse(center,
-                                    self.config.rim_radius,
-                                    self.config.rim_radius)
+                # 2. Draw the tile under the cursor with the pre-rendered hole and rim
+                painter.drawPixmap(tile.topLeft(), spot_pixmap)
+                return
+
+            # Qt does not clear the window (WA_OpaquePaintEvent), so clear the previous frame
+            painter.fillRect(dirty, Qt.GlobalColor.transparent)
+
+            if not self.overlay_active:
                 return
                 
             # Laser drawing
-            elif self.is_laser_mode:
-                if not self.laser_trail:
+            if self.is_laser_mode:
+                if not trail:
                     return
                 
                 painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-                total = len(self.laser_trail)
-                for i, pos in enumerate(self.laser_trail):
-                    # compute alpha and radius
-                    if total > 1:
-                        t = i / float(total - 1)
+                draw_pixmap = painter.drawPixmap
+                dots = config.laser_dot_pixmaps
+                dot_offset = config.laser_dot_offset
+                head = len(trail) - 1
+                # a short trail uses the newest part of the dot ramp
+                offset = len(dots) - len(trail)
+                for i, (x, y) in enumerate(trail):
+                    if i == head:
+                        head_offset = config.laser_head_offset
+                        draw_pixmap(x - head_offset, y - head_offset, config.laser_head_pixmap)
                     else:
-                        t = 1.0
-                    alpha = int(self.config.LASER_MIN_ALPHA + (255 - self.config.LASER_MIN_ALPHA) * t)
-                    radius = self.config.LASER_BASE_RADIUS
-                    if i == total - 1:
-                        radius *= self.config.LASER_HEAD_MULTIPLIER
-                        alpha = 255
-                    color = QColor(self.config.LASER_COLOR_BASE)
-                    color.setAlpha(alpha)
-                    painter.setBrush(QBrush(color))
-                    painter.drawEllipse(pos, radius, radius)
-
-    # macOS persistent overlay adjustments
-    def make_persistent_overlay(self):
-        if not IS_DARWIN:
+                        draw_pixmap(x - dot_offset, y - dot_offset, dots[offset + i])
+
+    # macOS persistent overlay adjustments, the NSWindow exists once the widget is shown
+    def showEvent(self, event):
+        super().showEvent(event)
+        if IS_DARWIN and not self._ns_configured:
+            # the native window is created while the show is processed, look it up afterwards
+            QTimer.singleShot(0, self._configure_ns_window)
+
+    def _configure_ns_window(self):
+        if self._ns_configured:
             return
+        nswindow = self._get_ns_window()
+        if nswindow is None:
+            self._ns_attempts += 1
+            if self._ns_attempts < self.NS_CONFIGURE_ATTEMPTS:
+                QTimer.singleShot(self.NS_CONFIGURE_RETRY_MS, self._configure_ns_window)
+            else:
+                print("macOS: no NSWindow for the overlay, it may take focus and mouse clicks.")
+            return
+        self._ns_configured = self.make_persistent_overlay(nswindow)
+
+    def _get_ns_window(self):
         try:
-            view_ptr = int(self.winId())
-            nsview = objc.objc_object(c_void_p=view_ptr)
-            nswindow = nsview.window()
-            if nswindow is None:
-                QTimer.singleShot(50, self.make_persistent_overlay)
-                return
-            try:
-                nswindow.setStyleMask_(NSBorderlessWindowMask | NSNonactivatingPanelMask)
-            except Exception:
-                pass
-            try:
-                behavior = (
-                    NSWindowCollectionBehaviorCanJoinAllSpaces
-                    | NSWindowCollectionBehaviorFullScreenAuxiliary
-                    | NSWindowCollectionBehaviorIgnoresCycle
-                )
-                nswindow.setCollectionBehavior_(behavior)
-            except Exception:
-                pass
-            try:
-                nswindow.setHidesOnDeactivate_(False)
-            except Exception:
-                pass
-            try:
-                nswindow.setLevel_(NSStatusWindowLevel)
-            except Exception:
-                pass
-            try:
-                nswindow.setIgnoresMouseEvents_(True)
-            except Exception:
-                pass
-            try:
-                nswindow.orderFrontRegardless()
-            except Exception:
-                pass
-            self._nswindow = nswindow
-            print("macOS: NSWindow adjusted for persistent overlay.")
+            nsview = objc.objc_object(c_void_p=int(self.winId()))
+            return nsview.window()
+        except Exception as exc:
+            print("macOS: looking up the NSWindow failed:", exc)
+            return None
+
+    def make_persistent_overlay(self, nswindow):
+        if not IS_DARWIN:
+            return False
+        # the overlay must stay above other windows and let clicks through, set that first
+        try:
+            nswindow.setLevel_(NSStatusWindowLevel)
+            nswindow.setIgnoresMouseEvents_(True)
         except Exception as exc:
             print("make_persistent_overlay failed:", exc)
+            return False
+        self._nswindow = nswindow
+        try:
+            nswindow.setStyleMask_(NSBorderlessWindowMask | NSNonactivatingPanelMask)
+            nswindow.setCollectionBehavior_(
+                NSWindowCollectionBehaviorCanJoinAllSpaces
+                | NSWindowCollectionBehaviorFullScreenAuxiliary
+                | NSWindowCollectionBehaviorIgnoresCycle
+            )
+            nswindow.setHidesOnDeactivate_(False)
+            nswindow.orderFrontRegardless()
+        except Exception as exc:
+            print("make_persistent_overlay: partial adjustment only:", exc)
+        print("macOS: NSWindow adjusted for persistent overlay.")
+        return True
 
 # -------------------------
 # Hotkey manager
 # -------------------------
+class EvdevHotKeys(threading.Thread):
+    """
+    Linux hotkey listener reading the keyboard devices directly.
+      hotkeys maps (modifiers, keycode) to a callback, modifiers being a frozenset of
+      "ctrl", "shift", "alt" and "meta" that must be held; other held modifiers are ignored,
+      as in pynput's GlobalHotKeys. stop() mirrors pynput's listeners
+      devices plugged in later are picked up by a rescan; when no device is left,
+      on_no_devices is called (to fall back to pynput) and the thread ends
+    """
+    MODIFIER_KEYS = {
+        ecodes.KEY_LEFTCTRL: "ctrl", ecodes.KEY_RIGHTCTRL: "ctrl",
+        ecodes.KEY_LEFTSHIFT: "shift", ecodes.KEY_RIGHTSHIFT: "shift",
+        ecodes.KEY_LEFTALT: "alt", ecodes.KEY_RIGHTALT: "alt",
+        ecodes.KEY_LEFTMETA: "meta", ecodes.KEY_RIGHTMETA: "meta",
+    } if HAS_EVDEV else {}
+    RESCAN_INTERVAL = 2.0 # seconds
+
+    def __init__(self, devices, hotkeys, on_no_devices):
+        super().__init__(daemon=True)
+        self._devices = {dev.fd: dev for dev in devices}
+        # keycode -> [(modifiers, callback)]
+        self._hotkeys = {}
+        for (modifiers, code), callback in hotkeys.items():
+            self._hotkeys.setdefault(code, []).append((modifiers, callback))
+        self._on_no_devices = on_no_devices
+        self._modifiers_down = set()
+        # device nodes seen by the last scan, a rescan only opens devices when this changes
+        self._known_paths = set(evdev.list_devices())
+        self._running = True
+
+    @staticmethod
+    def open_keyboards(skip_paths=()):
+        devices = []
+        for path in evdev.list_devices():
+            if path in skip_paths:
+                continue
+            try:
+                dev = evdev.InputDevice(path)
+            except OSError:
+                # no read access to this device
+                continue
+            if ecodes.KEY_L in dev.capabilities().get(ecodes.EV_KEY, []):
+                devices.append(dev)
+            else:
+                dev.close()
+        return devices
+
+    def stop(self):
+        self._running = False
+
+    def _rescan(self):
+        paths = set(evdev.list_devices())
+        if paths == self._known_paths:
+            return
+        self._known_paths = paths
+        open_paths = {dev.path for dev in self._devices.values()}
+        for dev in self.open_keyboards(open_paths):
+            print(f"evdev: listening for hotkeys on {dev.name}.")
+            self._devices[dev.fd] = dev
+
+    def run(self):
+        next_rescan = time.monotonic() + self.RESCAN_INTERVAL
+        while self._running:
+            if not self._devices or time.monotonic() >= next_rescan:
+                self._rescan()
+                next_rescan = time.monotonic() + self.RESCAN_INTERVAL
+                if not self._devices:
+                    print("evdev: no readable keyboard left, falling back to pynput.")
+                    self._on_no_devices()
+                    return
+            # the timeout bounds how long stop() and new devices take to be noticed
+            readable, _, _ = select.select(list(self._devices), [], [], 0.5)
+            for fd in readable:
+                try:
+                    events = list(self._devices[fd].read())
+                except OSError:
+                    # device unplugged, forget its node so a replug under the same node is rescanned
+                    dev = self._devices.pop(fd)
+                    self._known_paths.discard(dev.path)
+                    dev.close()
+                    self._modifiers_down.clear()
+                    continue
+                for event in events:
+                    if event.type == ecodes.EV_KEY:
+                        self._on_key(event.code, event.value)
+        for dev in self._devices.values():
+            dev.close()
+
+    def _on_key(self, code, value):
+        # value: 0 = release, 1 = press, 2 = autorepeat
+        if code in self.MODIFIER_KEYS:
+            if value:
+                self._modifiers_down.add(code)
+            else:
+                self._modifiers_down.discard(code)
+            return
+        if value != 1:
+            return
+        held = {self.MODIFIER_KEYS[c] for c in self._modifiers_down}
+        for modifiers, callback in self._hotkeys.get(code, ()):
+            if modifiers <= held:
+                callback()
+
+
 def start_overlay_hotkey_manager():
-    global emitter, global_state, hotkey_listener
+    global emitter, global_state, hotkey_listener, mouse_listener
 
     def handle_mode_switch():
         new_mode = global_state.cycle_mode()
@@ -599,38 +985,65 @@ def start_overlay_hotkey_manager():
         return True
 
     def handle_quit():
-        global hotkey_listener
+        global hotkey_listener, mouse_listener
         print("\n[Application Shutdown] Received Ctrl+Q. Initiating clean exit.")
         if hotkey_listener:
             hotkey_listener.stop()
+        if mouse_listener:
+            mouse_listener.stop()
         emitter.app_quit.emit()
 
-    hotkeys = {
-        '<ctrl>+l': handle_activate,
-        '<ctrl>+a': handle_deactivate,
-        'e': handle_mode_switch,
-        '<ctrl>+q': handle_quit
-    }
-
-    h = keyboard.GlobalHotKeys(hotkeys)
-    hotkey_listener = h
-    h.start()
+    def start_pynput_hotkeys():
+        global hotkey_listener
+        hotkeys = {
+            '<ctrl>+l': handle_activate,
+            '<ctrl>+a': handle_deactivate,
+            'e': handle_mode_switch,
+            '<ctrl>+q': handle_quit
+        }
+        h = keyboard.GlobalHotKeys(hotkeys)
+        hotkey_listener = h
+        h.start()
+
+    # linux: read the keyboards directly when evdev and access to /dev/input are available
+    devices = EvdevHotKeys.open_keyboards() if HAS_EVDEV else []
+    if devices:
+        ctrl = frozenset({"ctrl"})
+        h = EvdevHotKeys(devices, {
+            (ctrl, ecodes.KEY_L): handle_activate,
+            (ctrl, ecodes.KEY_A): handle_deactivate,
+            (frozenset(), ecodes.KEY_E): handle_mode_switch,
+            (ctrl, ecodes.KEY_Q): handle_quit,
+        }, on_no_devices=start_pynput_hotkeys)
+        print(f"Listening for hotkeys on {len(devices)} input device(s) via evdev.")
+        hotkey_listener = h
+        h.start()
+    else:
+        start_pynput_hotkeys()
+
+    # the overlay is transparent for input, so mouse moves are taken from the system;
+    # only used as a trigger, the position is read with QCursor in the GUI thread
+    def on_mouse_move(x, y):
+        if emitter.tracking and not emitter.move_pending:
+            emitter.move_pending = True
+            emitter.mouse_moved.emit()
+
+    m = mouse.Listener(on_move=on_mouse_move)
+    mouse_listener = m
+    m.start()
 
 # -------------------------
 # Main application
 # -------------------------
 def main():
+    global global_config, global_state
     app = QApplication(sys.argv)
 
-    # Helper function to get initial geometry
-    def _get_current_screen_geometry():
-        cursor_pos = QCursor.pos()
-        screen = QApplication.screenAt(cursor_pos)
-        if screen is None:
-            return QApplication.primaryScreen().geometry()
-        return screen.geometry()
-
-    initial_geometry = _get_current_screen_geometry()
+    global_config = Config()
+    global_config.load_config()
+    initial_geometry = PresenterOverlay._get_current_screen_geometry()
+    global_config.build_qt_resources(PresenterOverlay._screen_device_pixel_ratio(initial_geometry))
+    global_state = GlobalState(global_config)
 
     global emitter
     emitter = KeyboardSignalEmitter() 